@@ -18,10 +18,6 @@ if getattr(sys, 'frozen', False):
     if APPLICATION_PATH not in sys.path:
         sys.path.insert(0, APPLICATION_PATH)
     
-    # Suppress pip output
-    import warnings
-    warnings.filterwarnings('ignore')
-    
     print("🎬 Running as EXE - skipping dependency checks")
 else:
     # Running as Python script
@@ -33,55 +29,111 @@ else:
     
     # Quick dependency check
     import subprocess
-    import importlib.util
+    import importlib.metadata
     
+    # Distribution names, as pip knows them
     REQUIRED_PACKAGES = [
         'customtkinter',
-        'yt_dlp',
-        'PIL',
-        'pyperclip',
+        'yt-dlp',
+        'pillow',
         'requests',
     ]
     
-    missing = []
-    for package in REQUIRED_PACKAGES:
-        if importlib.util.find_spec(package) is None:
-            missing.append(package)
+    # Written after a successful check so later launches skip the scan.
+    # It names the interpreter, so another Python or venv still gets checked.
+    DEPS_SENTINEL = Path.home() / '.yt_pro_deps_ok'
+    DEPS_STAMP = '\n'.join([sys.executable, sys.prefix, *REQUIRED_PACKAGES])
     
-    if missing:
-        print(f"📦 Installing missing packages: {', '.join(missing)}")
-        for package in missing:
+    def check_dependencies():
+        """Install any missing packages, then record the check"""
+        installed = {
+            (dist.metadata['Name'] or '').lower().replace('_', '-')
+            for dist in importlib.metadata.distributions()
+        }
+        missing = [p for p in REQUIRED_PACKAGES if p not in installed]
+        
+        failed = False
+        if missing:
+            print(f"📦 Installing missing packages: {', '.join(missing)}")
+            # One pip run resolves everything together and skips its self-update check
             try:
                 subprocess.check_call(
-                    [sys.executable, "-m", "pip", "install", "--quiet", 
-                     package.replace('_', '-')]
+                    [sys.executable, "-m", "pip", "install", "--quiet",
+                     "--disable-pip-version-check", "--no-input", *missing]
                 )
-                print(f"✅ Installed {package}")
+                print("✅ All dependencies installed!")
             except:
-                print(f"⚠️ Failed to install {package}")
-        print("✅ All dependencies installed!")
-    else:
+                print(f"⚠️ Failed to install {', '.join(missing)}")
+                failed = True
+        else:
+            print("✅ All dependencies already installed!")
+        
+        if not failed:
+            try:
+                DEPS_SENTINEL.write_text(DEPS_STAMP)
+            except OSError:
+                pass
+    
+    try:
+        deps_ok = DEPS_SENTINEL.read_text() == DEPS_STAMP
+    except OSError:
+        deps_ok = False
+    
+    if deps_ok:
         print("✅ All dependencies already installed!")
+    else:
+        check_dependencies()
+
+def forget_dependency_check():
+    """Drop the dependency sentinel so the next check scans again"""
+    if not RUNNING_AS_EXE:
+        try:
+            DEPS_SENTINEL.unlink()
+        except OSError:
+            pass
 
 # ========== NOW SAFELY IMPORT ALL PACKAGES ==========
-import customtkinter as ctk
+try:
+    import customtkinter as ctk
+except ImportError:
+    if RUNNING_AS_EXE:
+        raise
+    # The sentinel vouched for a package that has since gone - check for real
+    forget_dependency_check()
+    check_dependencies()
+    importlib.invalidate_caches()  # Let the import see freshly installed packages
+    import customtkinter as ctk
 import tkinter as tk
-from tkinter import filedialog, messagebox
-import yt_dlp
+from tkinter import filedialog
 import threading
 import json
 import time
 from datetime import datetime
-import pyperclip
-from PIL import Image
-import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import subprocess
 import shutil
 import re
 import hashlib
 import pickle
-import webbrowser
+import socket
+import functools
+import colorsys
+from types import MappingProxyType, SimpleNamespace
+from urllib.parse import urlsplit, parse_qs
+
+# orjson is optional - much faster, same output as json
+try:
+    import orjson
+    
+    dump_json = orjson.dumps
+    load_json = orjson.loads
+except ImportError:
+    def dump_json(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    load_json = json.loads
 
 # ========== CONFIGURATION ==========
 
@@ -91,6 +143,217 @@ ctk.set_default_color_theme("dark-blue")
 APP_NAME = "YouTube Downloader Pro"
 APP_VERSION = "8.0 - EXE READY"
 
+# Keeps console programs from flashing a window on Windows (0 elsewhere)
+CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# Folder opener command per platform; Windows uses os.startfile and
+# other Unix desktops fall back to xdg-open
+FOLDER_OPENERS = MappingProxyType({'darwin': 'open'})
+
+DEFAULT_DOWNLOAD_PATH = str(Path.home() / "Downloads" / "YouTube Downloads")
+
+# Append-only log, one JSON item per line, oldest first
+HISTORY_FILE = Path.home() / '.yt_pro_history.jsonl'
+HISTORY_TMP_FILE = HISTORY_FILE.with_name(HISTORY_FILE.name + '.tmp')
+HISTORY_COMPACT_LINES = 1000  # Rewrite the log at startup once it grows past this
+# Pickled list written by older versions, migrated on first load
+LEGACY_HISTORY_FILE = Path.home() / '.yt_pro_history.dat'
+HISTORY_MAX_ITEMS = 20
+
+# Recent list decorations per download format
+FORMAT_ICONS = MappingProxyType({'mp4': "🎬", 'mp3': "🎵", 'mkv': "📦"})
+FORMAT_LABELS = MappingProxyType({'mp4': "MP4", 'mp3': "MP3", 'mkv': "MKV"})
+HISTORY_SAVE_DELAY_MS = 500  # Changes within this window share one write
+MAX_VISIBLE_ROWS = 15  # Recent list rows; the row widget pool never grows past this
+
+# Theme palette, shared by every widget
+COLORS = SimpleNamespace(
+    primary='#FF4444',
+    primary_disabled='#883333',
+    accent='#3EA6FF',
+    success='#4CAF50',
+    warning='#FFC107',
+    error='#F44336',
+    surface='#1E1E1E',
+    surface_light='#2D2D2D',
+)
+
+# Tab names double as the tabview's lookup keys
+TAB_DOWNLOAD = "📥 Download"
+TAB_SEARCH = "🔍 Search"
+TAB_QUEUE = "📋 Queue"
+TAB_SETTINGS = "⚙️ Settings"
+
+STATUS_READY = "✅ Ready"
+
+# Download button configurations, built once
+DOWNLOAD_BTN_READY = MappingProxyType({
+    'state': "normal",
+    'fg_color': COLORS.primary,
+    'hover': True,
+    'text': "🚀 START DOWNLOAD",
+})
+DOWNLOAD_BTN_DISABLED = MappingProxyType({
+    'state': "disabled",
+    'fg_color': COLORS.primary_disabled,
+    'hover': False,
+    'text': "🚫 ENTER URL FIRST",
+})
+DOWNLOAD_BTN_BUSY = MappingProxyType({
+    'state': "disabled",
+    'fg_color': COLORS.primary_disabled,
+    'text': "⏳ DOWNLOADING...",
+})
+
+# Speed limit setting -> bytes per second (None = unlimited)
+SPEED_LIMITS = MappingProxyType({
+    'unlimited': None,
+    'slow': 100 * 1024,
+    'medium': 500 * 1024,
+    'fast': 1024 * 1024,
+})
+
+QUALITY_OPTIONS = (
+    "144p", "240p", "360p", "480p", "720p",
+    "1080p", "1440p (2K)", "2160p (4K)"
+)
+
+# yt-dlp format selector for each quality option
+QUALITY_FORMATS = MappingProxyType({
+    '144p': 'worst[height<=144]',
+    '240p': 'best[height<=240]',
+    '360p': 'best[height<=360]',
+    '480p': 'best[height<=480]',
+    '720p': 'best[height<=720]',
+    '1080p': 'best[height<=1080]',
+    '1440p (2K)': 'best[height<=1440]',
+    '2160p (4K)': 'best[height<=2160]',
+})
+
+def retry_backoff(n):
+    """Exponential backoff between yt-dlp retries, capped at 30s"""
+    return min(2 ** n, 30)
+
+# yt-dlp options shared by every download
+BASE_DOWNLOAD_OPTS = MappingProxyType({
+    'quiet': True,
+    'no_warnings': True,
+    'noplaylist': True,
+    # Fetch DASH/HLS fragments over several connections at once
+    'concurrent_fragment_downloads': 4,
+    'socket_timeout': 30,
+    # Retry with exponential backoff - embedded yt-dlp retries no fragments by default
+    'retries': 3,
+    'fragment_retries': 10,
+    'retry_sleep_functions': {
+        'http': retry_backoff,
+        'fragment': retry_backoff,
+    },
+})
+
+def video_cache_key(url):
+    """Canonical analysis cache key, shared by every link form of a video"""
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    is_short_link = host == 'youtu.be'
+    # Other sites' ids could collide with YouTube's - key them by the URL
+    if not (is_short_link or host == 'youtube.com' or host.endswith('.youtube.com')):
+        return url
+    query = parse_qs(parts.query)
+    # Analysis expands a link carrying a list into the whole playlist
+    if 'list' in query:
+        return 'list:' + query['list'][0]
+    if is_short_link:
+        return parts.path.strip('/').split('/')[0] or url
+    if 'v' in query:
+        return query['v'][0]
+    segments = parts.path.strip('/').split('/')
+    if len(segments) >= 2 and segments[0] in ('shorts', 'live', 'embed'):
+        return segments[1]
+    return url
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+def canon_query(query):
+    """Search cache key - case, spacing and trailing punctuation don't matter"""
+    return WHITESPACE_RE.sub(' ', query.strip().lower()).rstrip('?!.')
+
+@functools.lru_cache(maxsize=512)
+def fmt_mmss(seconds):
+    """m:ss text for a duration or ETA - a steady ETA hits the cache"""
+    m, sec = divmod(seconds, 60)
+    return f"{m}:{sec:02d}"
+
+# Video, Shorts, playlist and youtu.be links
+YOUTUBE_URL_RE = re.compile(
+    r'^https?://(?:(?:[\w-]+\.)*youtube\.com/(?:watch\?|playlist\?|shorts/|live/|embed/)|youtu\.be/)\S',
+    re.I
+)
+
+# Key releases that can't change the URL entry's text
+NON_EDIT_KEYS = frozenset({
+    'Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next',
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+    'Meta_L', 'Meta_R', 'Super_L', 'Super_R', 'Caps_Lock', 'Tab', 'Escape',
+})
+
+# Analyzed video info cache (in-memory LRU backed by a disk tier)
+CACHE_DIR = Path.home() / '.yt_pro_cache'
+CACHE_MAX_ITEMS = 128
+CACHE_DISK_MAX_ITEMS = 1024
+CACHE_TTL = 3600
+
+# Result rows rendered per idle pass
+RESULT_RENDER_CHUNK = 3
+
+# Search results cache (in-memory LRU)
+SEARCH_CACHE_MAX_ITEMS = 64
+SEARCH_CACHE_TTL = 600
+
+# Raw analysis results are reused for downloads started within this many
+# seconds; format URLs expire, so keep it short
+PREFETCH_TTL = 120
+
+# Result of the last "ffmpeg -version" probe, for when it isn't on PATH
+FFMPEG_CACHE_FILE = Path.home() / '.yt_pro_ffmpeg.json'
+FFMPEG_CACHE_TTL = 24 * 3600
+
+# Search result thumbnails
+THUMB_SIZE = (120, 68)
+THUMB_WORKERS = 8
+THUMB_DIR = Path.home() / '.yt_pro_thumbs'
+THUMB_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# ========== DNS CACHE ==========
+
+# yt-dlp and requests resolve the same few YouTube hosts over and over
+_system_getaddrinfo = socket.getaddrinfo
+
+@functools.lru_cache(maxsize=256)
+def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with in-process memoization"""
+    return _system_getaddrinfo(host, port, family, type, proto, flags)
+
+def install_dns_cache():
+    """Route all name lookups in this process through the cache"""
+    socket.getaddrinfo = cached_getaddrinfo
+
+DNS_CACHE_TTL_MS = 5 * 60 * 1000
+
+# Minimum milliseconds between progress redraws (10 Hz)
+PROGRESS_INTERVAL_MS = 100
+INV_MB = 1.0 / 1048576.0
+
+# ========== COLOR HELPERS ==========
+
+@functools.lru_cache(maxsize=32)
+def lighten_color(color, amount=0.1):
+    """Raise the lightness of a #rrggbb color"""
+    r, g, b = (int(color[i:i + 2], 16) / 255 for i in (1, 3, 5))
+    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    r, g, b = colorsys.hls_to_rgb(h, min(1.0, l + amount), s)
+    return '#{:02x}{:02x}{:02x}'.format(round(r * 255), round(g * 255), round(b * 255))
+
 # ========== MAIN APPLICATION CLASS ==========
 
 class YouTubeDownloaderPro(ctk.CTk):
@@ -99,6 +362,10 @@ class YouTubeDownloaderPro(ctk.CTk):
     def __init__(self):
         super().__init__()
         
+        # Cache DNS lookups before any network work starts
+        install_dns_cache()
+        self.after(DNS_CACHE_TTL_MS, self.clear_dns_cache)
+        
         # Window setup
         self.title(f"🎬 {APP_NAME} v{APP_VERSION}")
         self.geometry("1200x800")
@@ -113,13 +380,56 @@ class YouTubeDownloaderPro(ctk.CTk):
             pass
         
         # Core variables
-        self.download_path = str(Path.home() / "Downloads" / "YouTube Downloads")
+        self.download_path = DEFAULT_DOWNLOAD_PATH
+        self.outtmpl = os.path.join(self.download_path, '%(title)s.%(ext)s')
         self.download_history = []
-        self.video_info_cache = {}
+        self.history_save_id = None
+        self.history_appends = []  # New items waiting for the next flush
+        self.history_future = None  # Most recent background history write
+        self.history_rewrite = False  # Whole list changed - rewrite the log
+        self.video_info_cache = OrderedDict()
+        self.search_cache = OrderedDict()  # canon_query(query) -> (monotonic time, results)
         self.current_url = ""
+        self.url_after_id = None
+        self.url_state = None
+        self.analyze_after_id = None
+        self.pending_progress = None
+        self.progress_scheduled = False
+        self.progress_lock = threading.Lock()
         self.is_analyzing = False
         self.analyze_start_time = 0
-        self.ffmpeg_available = False
+        self.analyze_ydl = None
+        self.search_ydl = None
+        self.download_ydls = {}  # option key -> idle YoutubeDL instances
+        self.prefetched_info = None  # (url, monotonic time, raw info) from analysis
+        self.search_generation = 0
+        self.result_thumb_labels = []
+        self.ffmpeg_available = None  # None until the background check reports
+        self.ffmpeg_status_label = None  # Built with the deferred Settings tab
+        
+        # Pooled HTTP session for thumbnails, created on first use (get_http)
+        self.http = None
+        self.http_lock = threading.Lock()
+        self.thumb_pool = ThreadPoolExecutor(max_workers=THUMB_WORKERS, thread_name_prefix="thumb")
+        self.thumb_pool.submit(self.prune_thumbnail_cache)
+        
+        # Searches and small background jobs share one persistent worker pool
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ytdl")
+        self.closing = False
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.executor.submit(self._prewarm_thread)
+        self.executor.submit(self.prune_info_cache)
+        
+        # Analysis runs on a small persistent pool instead of a thread per URL
+        self.analyze_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="analyze")
+        self.analyze_future = None
+        # Warm the slow yt-dlp import off the UI thread before the first click
+        self.analyze_pool.submit(self.preload_yt_dlp)
+        self.analyze_lock = threading.Lock()
+        self.search_lock = threading.Lock()
+        self.cache_lock = threading.Lock()
+        self.history_lock = threading.Lock()
+        self.download_ydl_lock = threading.Lock()
         
         # Settings
         self.settings = {
@@ -131,34 +441,19 @@ class YouTubeDownloaderPro(ctk.CTk):
             'theme': 'dark',
         }
         
-        # Speed limits
-        self.speed_limits = {
-            'unlimited': None,
-            'slow': 100 * 1024,
-            'medium': 500 * 1024,
-            'fast': 1024 * 1024,
-        }
+        # Downloads get their own pool so max_concurrent bounds them
+        self.download_pool = ThreadPoolExecutor(
+            max_workers=self.settings['max_concurrent'],
+            thread_name_prefix="ytdl-dl"
+        )
         
-        # Quality options
-        self.quality_options = [
-            "144p", "240p", "360p", "480p", "720p", 
-            "1080p", "1440p (2K)", "2160p (4K)"
-        ]
+        self.speed_limit_value = SPEED_LIMITS[self.settings['speed_limit']]
         
-        # Colors
-        self.colors = {
-            'primary': '#FF4444',
-            'primary_disabled': '#883333',
-            'accent': '#3EA6FF',
-            'success': '#4CAF50',
-            'warning': '#FFC107',
-            'error': '#F44336',
-            'surface': '#1E1E1E',
-            'surface_light': '#2D2D2D',
-        }
+        # Fonts are shared by every widget using the same size and weight
+        self.font_cache = {}
         
-        # Create download folder
-        os.makedirs(self.download_path, exist_ok=True)
+        # Download folders are created on first use, see ensure_download_dir
+        self.created_dirs = set()
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -171,12 +466,20 @@ class YouTubeDownloaderPro(ctk.CTk):
         self.load_history()
         
         # Check FFmpeg after UI loads
-        self.after(1000, self.check_ffmpeg)
+        self.check_ffmpeg()
         
         # Make sure window appears on top
         self.lift()
         self.focus_force()
     
+    def get_font(self, size, weight="normal"):
+        """Shared CTkFont for a size and weight"""
+        key = (size, weight)
+        font = self.font_cache.get(key)
+        if font is None:
+            font = self.font_cache[key] = ctk.CTkFont(size=size, weight=weight)
+        return font
+    
     def setup_ui(self):
         """Build the complete interface"""
         
@@ -190,22 +493,31 @@ class YouTubeDownloaderPro(ctk.CTk):
         self.main_tabview = ctk.CTkTabview(self)
         self.main_tabview.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         
-        self.main_tabview.add("📥 Download")
-        self.main_tabview.add("🔍 Search")
-        self.main_tabview.add("📋 Queue")
-        self.main_tabview.add("⚙️ Settings")
+        self.main_tabview.add(TAB_DOWNLOAD)
+        self.main_tabview.add(TAB_SEARCH)
+        self.main_tabview.add(TAB_QUEUE)
+        self.main_tabview.add(TAB_SETTINGS)
         
+        # Only the Download tab is visible at launch - build the rest once
+        # the window has painted, one tab per event loop turn
         self.setup_download_tab()
-        self.setup_search_tab()
-        self.setup_queue_tab()
-        self.setup_settings_tab()
+        self.after_idle(self.after, 1, self.build_deferred_tabs,
+                        (self.setup_search_tab, self.setup_queue_tab, self.setup_settings_tab))
         
         # Status bar
         self.create_status_bar()
     
+    def build_deferred_tabs(self, builders):
+        """Build the next deferred tab, leaving the rest until redraws have run"""
+        builders[0]()
+        # Idle handlers queued together run in one pass - a timer after the
+        # idle pass lets pending redraws go first
+        if len(builders) > 1:
+            self.after_idle(self.after, 1, self.build_deferred_tabs, builders[1:])
+    
     def create_header(self):
         """Header with FFmpeg status and theme switcher"""
-        header = ctk.CTkFrame(self, height=60, fg_color=self.colors['surface'])
+        header = ctk.CTkFrame(self, height=60, fg_color=COLORS.surface)
         header.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 10))
         header.grid_columnconfigure(1, weight=1)
         
@@ -216,14 +528,14 @@ class YouTubeDownloaderPro(ctk.CTk):
         ctk.CTkLabel(
             title_frame,
             text="🎬",
-            font=ctk.CTkFont(size=28)
+            font=self.get_font(28)
         ).pack(side="left", padx=(0, 5))
         
         ctk.CTkLabel(
             title_frame,
             text=APP_NAME,
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=self.colors['primary']
+            font=self.get_font(20, "bold"),
+            text_color=COLORS.primary
         ).pack(side="left")
         
         # EXE badge
@@ -231,8 +543,8 @@ class YouTubeDownloaderPro(ctk.CTk):
             ctk.CTkLabel(
                 header,
                 text="📦 EXE Mode",
-                font=ctk.CTkFont(size=11),
-                fg_color=self.colors['success'],
+                font=self.get_font(11),
+                fg_color=COLORS.success,
                 corner_radius=10,
                 padx=8
             ).grid(row=0, column=1, padx=10, sticky="e")
@@ -241,7 +553,7 @@ class YouTubeDownloaderPro(ctk.CTk):
         theme_frame = ctk.CTkFrame(header, fg_color="transparent")
         theme_frame.grid(row=0, column=2, padx=10, sticky="e")
         
-        ctk.CTkLabel(theme_frame, text="🌓", font=ctk.CTkFont(size=14)).pack(side="left", padx=5)
+        ctk.CTkLabel(theme_frame, text="🌓", font=self.get_font(14)).pack(side="left", padx=5)
         
         self.theme_menu = ctk.CTkOptionMenu(
             theme_frame,
@@ -256,8 +568,8 @@ class YouTubeDownloaderPro(ctk.CTk):
         self.ffmpeg_badge = ctk.CTkLabel(
             header,
             text="🎵 FFmpeg: Checking...",
-            font=ctk.CTkFont(size=11),
-            fg_color=self.colors['surface_light'],
+            font=self.get_font(11),
+            fg_color=COLORS.surface_light,
             corner_radius=10,
             padx=10
         )
@@ -267,7 +579,7 @@ class YouTubeDownloaderPro(ctk.CTk):
         ctk.CTkLabel(
             header,
             text=f"v{APP_VERSION}",
-            font=ctk.CTkFont(size=11),
+            font=self.get_font(11),
             text_color='gray'
         ).grid(row=0, column=4, padx=10)
     
@@ -277,10 +589,10 @@ class YouTubeDownloaderPro(ctk.CTk):
         actions.grid(row=1, column=0, sticky="ew", padx=20, pady=5)
         
         buttons = [
-            ("📋 Paste URL", self.paste_url, self.colors['primary']),
-            ("🎵 Music Mode", lambda: self.set_format('mp3'), self.colors['success']),
-            ("🎬 Video Mode", lambda: self.set_format('mp4'), self.colors['accent']),
-            ("📁 Open Folder", self.open_download_folder, self.colors['surface_light']),
+            ("📋 Paste URL", self.paste_url, COLORS.primary),
+            ("🎵 Music Mode", functools.partial(self.set_format, 'mp3'), COLORS.success),
+            ("🎬 Video Mode", functools.partial(self.set_format, 'mp4'), COLORS.accent),
+            ("📁 Open Folder", self.open_download_folder, COLORS.surface_light),
         ]
         
         for i, (text, cmd, color) in enumerate(buttons):
@@ -297,34 +609,34 @@ class YouTubeDownloaderPro(ctk.CTk):
     
     def setup_download_tab(self):
         """Download tab"""
-        tab = self.main_tabview.tab("📥 Download")
+        tab = self.main_tabview.tab(TAB_DOWNLOAD)
         tab.grid_columnconfigure(0, weight=1)
         
         # URL Entry
-        url_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        url_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         url_frame.grid(row=0, column=0, sticky="ew", pady=5)
         
         self.url_entry = ctk.CTkEntry(
             url_frame,
             placeholder_text="Paste YouTube URL here and press Enter",
             height=50,
-            font=ctk.CTkFont(size=14)
+            font=self.get_font(14)
         )
         self.url_entry.pack(fill="x", padx=10, pady=10)
         self.url_entry.bind("<Return>", lambda e: self.analyze_url_fast(self.url_entry.get()))
         self.url_entry.bind("<KeyRelease>", self.on_url_change)
         
         # Format selection
-        format_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        format_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         format_frame.grid(row=1, column=0, sticky="ew", pady=5)
         
-        ctk.CTkLabel(format_frame, text="Format:", font=ctk.CTkFont(size=13)).pack(side="left", padx=10)
+        ctk.CTkLabel(format_frame, text="Format:", font=self.get_font(13)).pack(side="left", padx=10)
         
         self.format_var = ctk.StringVar(value="mp4")
         formats = [
-            ("🎬 MP4 Video", "mp4", self.colors['primary']),
-            ("🎵 MP3 Audio", "mp3", self.colors['success']),
-            ("📦 MKV Video", "mkv", self.colors['accent']),
+            ("🎬 MP4 Video", "mp4", COLORS.primary),
+            ("🎵 MP3 Audio", "mp3", COLORS.success),
+            ("📦 MKV Video", "mkv", COLORS.accent),
         ]
         
         self.format_buttons = {}
@@ -334,19 +646,19 @@ class YouTubeDownloaderPro(ctk.CTk):
                 text=text,
                 width=120,
                 height=35,
-                fg_color=self.colors['surface_light'] if self.format_var.get() != value else color,
+                fg_color=COLORS.surface_light if self.format_var.get() != value else color,
                 hover_color=color,
-                command=lambda v=value, c=color: self.set_format_with_button(v, c)
+                command=functools.partial(self.set_format_with_button, value, color)
             )
             btn.pack(side="left", padx=2)
             self.format_buttons[value] = btn
         
         # Quality
-        ctk.CTkLabel(format_frame, text="Quality:", font=ctk.CTkFont(size=13)).pack(side="left", padx=(20, 5))
+        ctk.CTkLabel(format_frame, text="Quality:", font=self.get_font(13)).pack(side="left", padx=(20, 5))
         self.quality_var = ctk.StringVar(value="1080p")
         self.quality_menu = ctk.CTkOptionMenu(
             format_frame,
-            values=self.quality_options,
+            values=list(QUALITY_OPTIONS),
             variable=self.quality_var,
             width=130,
             command=self.on_quality_change
@@ -357,7 +669,7 @@ class YouTubeDownloaderPro(ctk.CTk):
         self.quality_indicator = ctk.CTkLabel(
             format_frame,
             text="",
-            font=ctk.CTkFont(size=16)
+            font=self.get_font(16)
         )
         self.quality_indicator.pack(side="left", padx=5)
         self.update_quality_indicator()
@@ -382,9 +694,9 @@ class YouTubeDownloaderPro(ctk.CTk):
             tab,
             text="🚀 START DOWNLOAD",
             height=60,
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self.get_font(18, "bold"),
             command=self.start_download_fast,
-            fg_color=self.colors['primary_disabled'],
+            fg_color=COLORS.primary_disabled,
             state="disabled",
             hover=False
         )
@@ -395,11 +707,11 @@ class YouTubeDownloaderPro(ctk.CTk):
         self.progress_bar.grid(row=3, column=0, sticky="ew", pady=5)
         self.progress_bar.set(0)
         
-        self.progress_label = ctk.CTkLabel(tab, text="", font=ctk.CTkFont(size=12))
+        self.progress_label = ctk.CTkLabel(tab, text="", font=self.get_font(12))
         self.progress_label.grid(row=4, column=0)
         
         # Speed and ETA
-        self.speed_label = ctk.CTkLabel(tab, text="", font=ctk.CTkFont(size=11))
+        self.speed_label = ctk.CTkLabel(tab, text="", font=self.get_font(11))
         self.speed_label.grid(row=5, column=0)
         
         # Recent downloads with clear button
@@ -409,7 +721,7 @@ class YouTubeDownloaderPro(ctk.CTk):
         ctk.CTkLabel(
             recent_header,
             text="📋 Recent Downloads",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.get_font(14, "bold")
         ).pack(side="left")
         
         # Clear history button
@@ -419,8 +731,8 @@ class YouTubeDownloaderPro(ctk.CTk):
             width=100,
             height=30,
             command=self.clear_history,
-            fg_color=self.colors['surface_light'],
-            hover_color=self.colors['error']
+            fg_color=COLORS.surface_light,
+            hover_color=COLORS.error
         )
         self.clear_history_btn.pack(side="right", padx=5)
         
@@ -431,35 +743,44 @@ class YouTubeDownloaderPro(ctk.CTk):
             width=80,
             height=30,
             command=self.refresh_recent,
-            fg_color=self.colors['surface_light']
+            fg_color=COLORS.surface_light
         )
         self.refresh_btn.pack(side="right", padx=5)
         
         # Recent downloads list
-        recent_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        recent_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         recent_frame.grid(row=7, column=0, sticky="nsew", pady=5)
         tab.grid_rowconfigure(7, weight=1)
         
         self.recent_list = ctk.CTkScrollableFrame(recent_frame, height=150)
         self.recent_list.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # Row widgets are kept and reused across refreshes
+        self.recent_rows = []
+        self.recent_empty_label = ctk.CTkLabel(
+            self.recent_list,
+            text="✨ No downloads yet",
+            font=self.get_font(12),
+            text_color='gray'
+        )
     
     def setup_search_tab(self):
         """Search tab"""
-        tab = self.main_tabview.tab("🔍 Search")
+        tab = self.main_tabview.tab(TAB_SEARCH)
         tab.grid_columnconfigure(0, weight=1)
         
         # Search bar
-        search_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        search_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         search_frame.grid(row=0, column=0, sticky="ew", pady=5)
         search_frame.grid_columnconfigure(1, weight=1)
         
-        ctk.CTkLabel(search_frame, text="🔍", font=ctk.CTkFont(size=20)).grid(row=0, column=0, padx=10)
+        ctk.CTkLabel(search_frame, text="🔍", font=self.get_font(20)).grid(row=0, column=0, padx=10)
         
         self.search_entry = ctk.CTkEntry(
             search_frame,
             placeholder_text="Search for videos...",
             height=40,
-            font=ctk.CTkFont(size=13)
+            font=self.get_font(13)
         )
         self.search_entry.grid(row=0, column=1, sticky="ew", padx=5, pady=10)
         self.search_entry.bind("<Return>", lambda e: self.search_fast())
@@ -470,39 +791,55 @@ class YouTubeDownloaderPro(ctk.CTk):
             width=100,
             height=40,
             command=self.search_fast,
-            fg_color=self.colors['primary']
+            fg_color=COLORS.primary
         ).grid(row=0, column=2, padx=10)
         
         # Results
         self.search_results_frame = ctk.CTkScrollableFrame(tab)
         self.search_results_frame.grid(row=1, column=0, sticky="nsew", pady=5)
         tab.grid_rowconfigure(1, weight=1)
+        
+        # Result rows are kept and reused across searches
+        self.result_rows = []
+        self.pending_thumbs = {}  # Result index -> thumbnail that beat its row
+        self.blank_thumb = None
+        self.results_empty_label = ctk.CTkLabel(
+            self.search_results_frame, 
+            text="No results found",
+            font=self.get_font(14)
+        )
+        self.results_header_label = ctk.CTkLabel(
+            self.search_results_frame,
+            text="",
+            font=self.get_font(12, "bold"),
+            text_color=COLORS.accent
+        )
     
     def setup_queue_tab(self):
         """Queue tab"""
-        tab = self.main_tabview.tab("📋 Queue")
+        tab = self.main_tabview.tab(TAB_QUEUE)
         
         self.queue_text = ctk.CTkLabel(
             tab,
             text="Queue feature coming soon!\n\nFor now, use direct downloads.",
-            font=ctk.CTkFont(size=14),
+            font=self.get_font(14),
             text_color='gray'
         )
         self.queue_text.pack(expand=True)
     
     def setup_settings_tab(self):
         """Settings tab"""
-        tab = self.main_tabview.tab("⚙️ Settings")
+        tab = self.main_tabview.tab(TAB_SETTINGS)
         tab.grid_columnconfigure(0, weight=1)
         
         # Download settings
-        dl_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        dl_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         dl_frame.grid(row=0, column=0, sticky="ew", pady=5, padx=5)
         
         ctk.CTkLabel(
             dl_frame,
             text="📥 Download Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=(10, 5))
         
         # Download path
@@ -513,7 +850,7 @@ class YouTubeDownloaderPro(ctk.CTk):
         self.path_label = ctk.CTkLabel(
             path_frame,
             text=self.download_path,
-            fg_color=self.colors['surface_light'],
+            fg_color=COLORS.surface_light,
             corner_radius=5,
             padx=5
         )
@@ -541,13 +878,13 @@ class YouTubeDownloaderPro(ctk.CTk):
         self.speed_menu.set("Unlimited")
         
         # Appearance settings
-        appearance_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        appearance_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         appearance_frame.grid(row=1, column=0, sticky="ew", pady=5, padx=5)
         
         ctk.CTkLabel(
             appearance_frame,
             text="🎨 Appearance",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=(10, 5))
         
         theme_frame = ctk.CTkFrame(appearance_frame, fg_color="transparent")
@@ -564,13 +901,13 @@ class YouTubeDownloaderPro(ctk.CTk):
         theme_menu.set(self.settings['theme'].title())
         
         # History management
-        history_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        history_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         history_frame.grid(row=2, column=0, sticky="ew", pady=5, padx=5)
         
         ctk.CTkLabel(
             history_frame,
             text="📋 History Management",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=(10, 5))
         
         btn_frame = ctk.CTkFrame(history_frame, fg_color="transparent")
@@ -580,7 +917,7 @@ class YouTubeDownloaderPro(ctk.CTk):
             btn_frame,
             text="🗑️ Clear Download History",
             command=self.clear_history,
-            fg_color=self.colors['error'],
+            fg_color=COLORS.error,
             width=200,
             height=35
         ).pack(side="left", padx=5)
@@ -589,49 +926,50 @@ class YouTubeDownloaderPro(ctk.CTk):
             btn_frame,
             text="🔄 Refresh History",
             command=self.refresh_recent,
-            fg_color=self.colors['surface_light'],
+            fg_color=COLORS.surface_light,
             width=150,
             height=35
         ).pack(side="left", padx=5)
         
         # FFmpeg section
-        ff_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        ff_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         ff_frame.grid(row=3, column=0, sticky="ew", pady=5, padx=5)
         
         ctk.CTkLabel(
             ff_frame,
             text="🎵 FFmpeg",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=(10, 5))
         
         self.ffmpeg_status_label = ctk.CTkLabel(
             ff_frame,
             text="Checking...",
-            font=ctk.CTkFont(size=12)
+            font=self.get_font(12)
         )
         self.ffmpeg_status_label.pack(anchor="w", padx=10, pady=5)
+        self.update_ffmpeg_status_label()
         
         # About
-        about_frame = ctk.CTkFrame(tab, fg_color=self.colors['surface'])
+        about_frame = ctk.CTkFrame(tab, fg_color=COLORS.surface)
         about_frame.grid(row=4, column=0, sticky="ew", pady=5, padx=5)
         
         ctk.CTkLabel(
             about_frame,
             text=f"{APP_NAME} v{APP_VERSION}\nEXE Ready - No dependencies needed!\nSupports up to 4K quality",
-            font=ctk.CTkFont(size=12),
+            font=self.get_font(12),
             text_color='gray'
         ).pack(pady=10)
     
     def create_status_bar(self):
         """Status bar"""
-        status = ctk.CTkFrame(self, height=25, fg_color=self.colors['surface'])
+        status = ctk.CTkFrame(self, height=25, fg_color=COLORS.surface)
         status.grid(row=3, column=0, sticky="ew", padx=20, pady=(0, 10))
         status.grid_columnconfigure(0, weight=1)
         
         self.status_label = ctk.CTkLabel(
             status,
-            text="✅ Ready",
-            font=ctk.CTkFont(size=11),
+            text=STATUS_READY,
+            font=self.get_font(11),
             anchor="w"
         )
         self.status_label.grid(row=0, column=0, padx=10, sticky="w")
@@ -640,25 +978,28 @@ class YouTubeDownloaderPro(ctk.CTk):
     
     def on_url_change(self, event):
         """Handle URL input changes"""
-        url = self.url_entry.get().strip()
-        self.update_download_button_state(url)
+        if event.keysym in NON_EDIT_KEYS:
+            return
+        
+        # Debounce - only the last key release in a burst updates the button
+        if self.url_after_id is not None:
+            self.after_cancel(self.url_after_id)
+        self.url_after_id = self.after(150, self.apply_url_change)
+    
+    def apply_url_change(self):
+        """Apply a debounced URL change"""
+        self.url_after_id = None
+        self.update_download_button_state(self.url_entry.get().strip())
     
     def update_download_button_state(self, url):
         """Update download button state"""
-        if url and ('youtube.com' in url or 'youtu.be' in url or url.startswith('http')):
-            self.download_btn.configure(
-                state="normal",
-                fg_color=self.colors['primary'],
-                hover=True,
-                text="🚀 START DOWNLOAD"
-            )
-        else:
-            self.download_btn.configure(
-                state="disabled",
-                fg_color=self.colors['primary_disabled'],
-                hover=False,
-                text="🚫 ENTER URL FIRST"
-            )
+        # Skip the button redraw when validity hasn't changed
+        valid = bool(YOUTUBE_URL_RE.match(url))
+        if valid == self.url_state:
+            return
+        self.url_state = valid
+        
+        self.download_btn.configure(**(DOWNLOAD_BTN_READY if valid else DOWNLOAD_BTN_DISABLED))
     
     def set_format_with_button(self, format_type, color):
         """Set format and update button colors"""
@@ -668,7 +1009,7 @@ class YouTubeDownloaderPro(ctk.CTk):
             if fmt == format_type:
                 btn.configure(fg_color=color)
             else:
-                btn.configure(fg_color=self.colors['surface_light'])
+                btn.configure(fg_color=COLORS.surface_light)
         
         if format_type == 'mp3':
             self.audio_frame.pack(side="left", padx=10)
@@ -690,10 +1031,10 @@ class YouTubeDownloaderPro(ctk.CTk):
     def update_quality_indicator(self):
         """Update quality indicator dots"""
         current = self.quality_var.get()
-        if current in self.quality_options:
-            index = self.quality_options.index(current) + 1
+        if current in QUALITY_OPTIONS:
+            index = QUALITY_OPTIONS.index(current) + 1
             dots = "●" * index
-            self.quality_indicator.configure(text=dots, text_color=self.colors['success'])
+            self.quality_indicator.configure(text=dots, text_color=COLORS.success)
     
     def change_theme(self, theme):
         """Change application theme"""
@@ -706,64 +1047,180 @@ class YouTubeDownloaderPro(ctk.CTk):
             self.show_notification("📋 History already empty")
             return
         
-        if messagebox.askyesno(
+        self.confirm(
             "Clear History",
-            f"Clear all {len(self.download_history)} items from history?"
-        ):
-            self.download_history.clear()
-            self.save_history()
-            self.refresh_recent()
-            self.show_notification("🗑️ History cleared")
+            f"Clear all {len(self.download_history)} items from history?",
+            self.clear_history_confirmed
+        )
+    
+    def clear_history_confirmed(self):
+        """Clear download history after confirmation"""
+        self.download_history.clear()
+        self.save_history()
+        self.refresh_recent()
+        self.show_notification("🗑️ History cleared")
+    
+    def confirm(self, title, message, on_yes):
+        """Ask a yes/no question without blocking the event loop"""
+        # Unlike messagebox, this returns immediately so queued progress
+        # updates keep flowing while the dialog is open
+        dialog = ctk.CTkToplevel(self)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.transient(self)
+        
+        ctk.CTkLabel(
+            dialog,
+            text=message,
+            font=self.get_font(13),
+            wraplength=300
+        ).pack(padx=20, pady=(20, 10))
+        
+        def answer(yes):
+            dialog.grab_release()
+            dialog.destroy()
+            if yes:
+                on_yes()
+        
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(pady=(0, 15))
+        
+        ctk.CTkButton(
+            btn_frame,
+            text="Yes",
+            width=80,
+            command=lambda: answer(True),
+            fg_color=COLORS.primary
+        ).pack(side="left", padx=5)
+        
+        ctk.CTkButton(
+            btn_frame,
+            text="No",
+            width=80,
+            command=lambda: answer(False),
+            fg_color=COLORS.surface_light
+        ).pack(side="left", padx=5)
+        
+        dialog.protocol("WM_DELETE_WINDOW", lambda: answer(False))
+        dialog.after(10, dialog.grab_set)  # Grab once the window is mapped
     
     def analyze_url_fast(self, url):
         """Fast URL analysis"""
-        if not url or self.is_analyzing:
+        if not url or (self.is_analyzing and url == self.current_url):
             return
         
+        # The newest URL wins - results for older ones are dropped
+        self.current_url = url
+        
         # Check cache
-        cache_key = hashlib.md5(url.encode()).hexdigest()
-        if cache_key in self.video_info_cache:
-            cache_time, info = self.video_info_cache[cache_key]
-            if time.time() - cache_time < 300:
-                self.show_video_info_fast(info)
-                return
+        info = self.get_cached_info(url)
+        if info is not None:
+            self.is_analyzing = False
+            self.show_video_info_fast(info)
+            return
+        
+        # Drop a superseded analysis that hasn't started yet
+        if self.analyze_future is not None:
+            self.analyze_future.cancel()
         
         self.is_analyzing = True
         self.analyze_start_time = time.time()
         self.status_label.configure(text="⏳ Analyzing...")
         
-        thread = threading.Thread(target=self._analyze_fast_thread, args=(url, cache_key))
-        thread.daemon = True
-        thread.start()
+        self.analyze_future = self.analyze_pool.submit(self._analyze_fast_thread, url)
     
-    def _analyze_fast_thread(self, url, cache_key):
+    def schedule_analyze(self, url):
+        """Debounced analyze - a burst of pastes/loads runs one extraction"""
+        if self.analyze_after_id is not None:
+            self.after_cancel(self.analyze_after_id)
+        self.analyze_after_id = self.after(250, self.run_scheduled_analyze, url)
+    
+    def run_scheduled_analyze(self, url):
+        """Run the analyze queued by schedule_analyze"""
+        self.analyze_after_id = None
+        self.analyze_url_fast(url)
+    
+    def _analyze_fast_thread(self, url):
         """Background analysis"""
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,
-                'socket_timeout': 5,
+            # The disk tier is read here so a memory miss never blocks the UI
+            fast_info = self.get_disk_info(url)
+            if fast_info is not None:
+                if url == self.current_url:
+                    self.after(0, self.show_video_info_fast, fast_info)
+                return
+            
+            # YoutubeDL isn't thread-safe; the shared instance runs one call at a time
+            with self.analyze_lock:
+                # process=False skips format selection - analysis only needs metadata
+                info = self.get_analyze_ydl().extract_info(url, download=False, process=False)
+            
+            is_playlist = 'entries' in info
+            if is_playlist:
+                # Prefer the counts yt-dlp reports over walking the entries
+                video_count = (info.get('playlist_count') or info.get('n_entries')
+                               or self.count_entries(info['entries']))
+            else:
+                video_count = 1
+            
+            fast_info = {
+                'title': info.get('title', 'Unknown')[:60],
+                'channel': info.get('channel', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'is_playlist': is_playlist,
+                'video_count': video_count,
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                fast_info = {
-                    'title': info.get('title', 'Unknown')[:60],
-                    'channel': info.get('channel', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'is_playlist': 'entries' in info,
-                    'video_count': len(info['entries']) if 'entries' in info else 1,
-                }
-                
-                self.video_info_cache[cache_key] = (time.time(), fast_info)
+            self.cache_info(url, fast_info)
+            if info.get('_type', 'video') == 'video':
+                # Keep the raw extraction so a prompt download can skip re-extracting
+                with self.cache_lock:
+                    self.prefetched_info = (url, time.monotonic(), info)
+            if url == self.current_url:
                 self.after(0, self.show_video_info_fast, fast_info)
-                
+            
         except Exception as e:
-            self.after(0, lambda: self.status_label.configure(text="❌ Analysis failed"))
+            if isinstance(e, ImportError):
+                forget_dependency_check()
+            if url == self.current_url:
+                self.after(0, lambda: self.status_label.configure(text="❌ Analysis failed"))
         finally:
-            self.is_analyzing = False
+            if url == self.current_url:
+                self.is_analyzing = False
+    
+    def take_prefetched_info(self, url):
+        """Hand over the last analysis result for url if it is still fresh"""
+        with self.cache_lock:
+            prefetched, self.prefetched_info = self.prefetched_info, None
+        if prefetched is None:
+            return None
+        prefetched_url, stamp, info = prefetched
+        if prefetched_url != url or time.monotonic() - stamp >= PREFETCH_TTL:
+            return None
+        return info
+    
+    def count_entries(self, entries):
+        """Count playlist entries, which may be a lazy generator when unprocessed"""
+        try:
+            return len(entries)
+        except TypeError:
+            return sum(1 for _ in entries)
+    
+    def get_analyze_ydl(self):
+        """Shared YoutubeDL for analysis, created on first use"""
+        if self.analyze_ydl is None:
+            import yt_dlp
+            self.analyze_ydl = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': True,
+                'skip_download': True,
+                # Analysis should fail fast on dead URLs, not back off and retry
+                'socket_timeout': 5,
+                'retries': 0,
+                'extractor_retries': 1,
+            })
+        return self.analyze_ydl
     
     def show_video_info_fast(self, info):
         """Show video info"""
@@ -773,7 +1230,10 @@ class YouTubeDownloaderPro(ctk.CTk):
             status = f"📋 Playlist: {info['video_count']} videos ({analyze_time:.1f}s)"
         else:
             dur = info['duration']
-            dur_str = f"{dur//60}:{dur%60:02d}" if dur else "?:??"
+            if dur:
+                dur_str = fmt_mmss(int(dur))
+            else:
+                dur_str = "?:??"
             status = f"✅ {info['title']} | {dur_str} | {info['channel']} ({analyze_time:.1f}s)"
         
         self.status_label.configure(text=status)
@@ -786,121 +1246,158 @@ class YouTubeDownloaderPro(ctk.CTk):
             self.show_notification("⚠️ Enter URL first")
             return
         
-        self.download_btn.configure(state="disabled", text="⏳ DOWNLOADING...", fg_color=self.colors['primary_disabled'])
+        self.download_btn.configure(**DOWNLOAD_BTN_BUSY)
+        self.url_state = None
         self.progress_bar.set(0)
         self.progress_label.configure(text="Starting...")
         
-        thread = threading.Thread(target=self._download_fast_thread, args=(url,))
-        thread.daemon = True
-        thread.start()
+        self.download_pool.submit(self._download_fast_thread, url)
     
     def _download_fast_thread(self, url):
         """Fast download thread"""
         try:
+            self.ensure_download_dir()
             format_type = self.format_var.get()
+            quality = (self.audio_quality_var if format_type == 'mp3' else self.quality_var).get()
             
-            ydl_opts = {
-                'outtmpl': os.path.join(self.download_path, '%(title)s.%(ext)s'),
-                'progress_hooks': [self.progress_hook_fast],
-                'quiet': True,
-                'no_warnings': True,
-                'noplaylist': True,
-            }
-            
-            if format_type == 'mp3':
-                quality = self.audio_quality_var.get().split()[0]
-                ydl_opts.update({
-                    'format': 'bestaudio/best',
-                    'postprocessors': [{
-                        'key': 'FFmpegExtractAudio',
-                        'preferredcodec': 'mp3',
-                        'preferredquality': quality,
-                    }],
-                })
-            else:
-                quality_map = {
-                    '144p': 'worst[height<=144]',
-                    '240p': 'best[height<=240]',
-                    '360p': 'best[height<=360]',
-                    '480p': 'best[height<=480]',
-                    '720p': 'best[height<=720]',
-                    '1080p': 'best[height<=1080]',
-                    '1440p (2K)': 'best[height<=1440]',
-                    '2160p (4K)': 'best[height<=2160]',
-                }
-                ydl_opts['format'] = quality_map.get(self.quality_var.get(), 'best')
-                if format_type != 'mp4':
-                    ydl_opts['merge_output_format'] = format_type
+            # Reuse an idle YoutubeDL built for the same options
+            key = (format_type, quality, self.settings.get('ffmpeg_path'),
+                   self.speed_limit_value, self.outtmpl)
+            with self.download_ydl_lock:
+                idle = self.download_ydls.get(key)
+                ydl = idle.pop() if idle else None
             
-            if self.settings['speed_limit'] != 'unlimited':
-                ydl_opts['ratelimit'] = self.speed_limits[self.settings['speed_limit']]
+            if ydl is None:
+                import yt_dlp  # Deferred: importing yt-dlp is slow, keep it off startup
+                ydl = yt_dlp.YoutubeDL(self.build_download_opts(format_type, quality))
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                self.after(0, self.add_to_history, info)
+            try:
+                prefetched = self.take_prefetched_info(url)
+                if prefetched is not None:
+                    info = ydl.process_ie_result(prefetched, download=True)
+                else:
+                    info = ydl.extract_info(url, download=True)
+            finally:
+                with self.download_ydl_lock:
+                    self.download_ydls.setdefault(key, []).append(ydl)
             
-            self.after(0, self.download_complete_fast)
+            # One callback per outcome so Tk redraws once
+            self.after(0, self.download_complete_fast, info)
             
         except Exception as e:
-            self.after(0, lambda: self.show_notification(f"❌ Error: {str(e)[:50]}"))
-            self.after(0, self.reset_download_button)
+            if isinstance(e, ImportError):
+                forget_dependency_check()
+            self.after(0, self.download_failed_fast, f"❌ Error: {str(e)[:50]}")
+    
+    def build_download_opts(self, format_type, quality):
+        """yt-dlp options for a download with the given format and quality"""
+        ydl_opts = {
+            **BASE_DOWNLOAD_OPTS,
+            'outtmpl': self.outtmpl,
+            'progress_hooks': [self.progress_hook_fast],
+        }
+        
+        if format_type == 'mp3':
+            ydl_opts.update({
+                'format': 'bestaudio/best',
+                'postprocessors': [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'mp3',
+                    'preferredquality': quality.split()[0],
+                }],
+            })
+        else:
+            ydl_opts['format'] = QUALITY_FORMATS.get(quality, 'best')
+            if format_type != 'mp4':
+                ydl_opts['merge_output_format'] = format_type
+        
+        if self.settings.get('ffmpeg_path'):
+            ydl_opts['ffmpeg_location'] = self.settings['ffmpeg_path']
+        
+        if self.speed_limit_value:
+            ydl_opts['ratelimit'] = self.speed_limit_value
+            # Parallel fragment connections would each get the full limit
+            ydl_opts['concurrent_fragment_downloads'] = 1
+        
+        return ydl_opts
     
     def progress_hook_fast(self, d):
         """Progress hook"""
+        # Pool threads aren't daemons - stop the transfer so the app can exit
+        if self.closing:
+            raise Exception("Application closing")
+        
         if d['status'] == 'downloading':
-            if 'total_bytes' in d:
-                percent = d['downloaded_bytes'] / d['total_bytes']
-                total_mb = d['total_bytes'] / 1024 / 1024
-                downloaded_mb = d['downloaded_bytes'] / 1024 / 1024
-            elif 'total_bytes_estimate' in d:
-                percent = d['downloaded_bytes'] / d['total_bytes_estimate']
-                total_mb = d['total_bytes_estimate'] / 1024 / 1024
-                downloaded_mb = d['downloaded_bytes'] / 1024 / 1024
-            else:
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if not total:
                 return
             
-            speed = d.get('speed', 0)
-            speed_mb = speed / 1024 / 1024 if speed else 0
-            eta = d.get('eta', 0)
-            eta_str = f"{eta//60}:{eta%60:02d}" if eta else "--:--"
-            
-            self.after(0, self.update_progress_fast, percent, speed_mb, eta_str, downloaded_mb, total_mb)
+            # yt-dlp calls this far more often than the eye can follow -
+            # keep only the latest raw snapshot and have at most one redraw
+            # queued; the formatting happens on the UI side
+            with self.progress_lock:
+                self.pending_progress = (d['downloaded_bytes'], total, d.get('speed'), d.get('eta'))
+                if self.progress_scheduled:
+                    return
+                self.progress_scheduled = True
+            self.after(0, self.flush_progress)
     
-    def update_progress_fast(self, percent, speed_mb, eta, downloaded, total):
+    def flush_progress(self):
+        """Draw the latest progress snapshot"""
+        with self.progress_lock:
+            snapshot, self.pending_progress = self.pending_progress, None
+        if snapshot is not None:
+            self.update_progress_fast(snapshot)
+        self.after(PROGRESS_INTERVAL_MS, self.allow_next_progress)
+    
+    def allow_next_progress(self):
+        """End the redraw cooldown, drawing anything that arrived during it"""
+        with self.progress_lock:
+            if self.pending_progress is None:
+                self.progress_scheduled = False
+                return
+        self.flush_progress()
+    
+    def update_progress_fast(self, snapshot):
         """Update progress display"""
+        downloaded, total, speed, eta = snapshot
+        percent = downloaded / total
+        
+        if eta:
+            eta_str = fmt_mmss(int(eta))
+        else:
+            eta_str = "--:--"
+        
         self.progress_bar.set(percent)
         self.progress_label.configure(
-            text=f"{percent*100:.1f}% | {downloaded:.1f} / {total:.1f} MB"
+            text=f"{percent*100:.1f}% | {downloaded * INV_MB:.1f} / {total * INV_MB:.1f} MB"
         )
         self.speed_label.configure(
-            text=f"⚡ {speed_mb:.1f} MB/s | ⏳ ETA: {eta}"
+            text=f"⚡ {(speed or 0) * INV_MB:.1f} MB/s | ⏳ ETA: {eta_str}"
         )
     
-    def download_complete_fast(self):
+    def download_complete_fast(self, info):
         """Download complete"""
+        with self.progress_lock:
+            self.pending_progress = None  # Don't let a late redraw cover the result
         self.reset_download_button()
         self.progress_label.configure(text="✅ Download Complete!")
         self.speed_label.configure(text="")
         self.show_notification("✅ Download complete!")
-        self.refresh_recent()
+        self.add_to_history(info)
+    
+    def download_failed_fast(self, msg):
+        """Download failed"""
+        with self.progress_lock:
+            self.pending_progress = None
+        self.show_notification(msg)
+        self.reset_download_button()
     
     def reset_download_button(self):
         """Reset download button"""
-        url = self.url_entry.get().strip()
-        if url:
-            self.download_btn.configure(
-                state="normal",
-                fg_color=self.colors['primary'],
-                hover=True,
-                text="🚀 START DOWNLOAD"
-            )
-        else:
-            self.download_btn.configure(
-                state="disabled",
-                fg_color=self.colors['primary_disabled'],
-                hover=False,
-                text="🚫 ENTER URL FIRST"
-            )
+        # The button was showing progress, so force a redraw
+        self.url_state = None
+        self.update_download_button_state(self.url_entry.get().strip())
     
     def search_fast(self):
         """Fast search"""
@@ -908,155 +1405,430 @@ class YouTubeDownloaderPro(ctk.CTk):
         if not query:
             return
         
-        self.status_label.configure(text=f"🔍 Searching: {query}")
+        self.search_generation += 1
+        
+        # Repeat searches are served from memory; thumbnails come from disk
+        results = self.get_cached_search(query)
+        if results is not None:
+            self.display_results_fast(results)
+            self.load_thumbnails(results, self.search_generation)
+            return
         
-        thread = threading.Thread(target=self._search_fast_thread, args=(query,))
-        thread.daemon = True
-        thread.start()
+        self.status_label.configure(text=f"🔍 Searching: {query}")
+        generation = self.search_generation
+        future = self.executor.submit(self._search_fast_thread, query)
+        future.add_done_callback(lambda f: self.after(0, self.search_done, f, generation))
+    
+    def get_cached_search(self, query):
+        """Get recent results for a query, if any"""
+        key = canon_query(query)
+        with self.cache_lock:
+            entry = self.search_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= SEARCH_CACHE_TTL:
+                del self.search_cache[key]
+                return None
+            self.search_cache.move_to_end(key)
+            return entry[1]
+    
+    def cache_search(self, query, results):
+        """Remember results for a query"""
+        key = canon_query(query)
+        with self.cache_lock:
+            self.search_cache[key] = (time.monotonic(), results)
+            self.search_cache.move_to_end(key)
+            if len(self.search_cache) > SEARCH_CACHE_MAX_ITEMS:
+                self.search_cache.popitem(last=False)
     
     def _search_fast_thread(self, query):
         """Search thread"""
+        search_query = f"ytsearch15:{query}"
+        results = []
+        with self.search_lock:
+            # process=False leaves entries as a generator over the search pages,
+            # turned straight into result dicts without yt-dlp's playlist pass
+            info = self.get_search_ydl().extract_info(search_query, download=False, process=False)
+            for entry in info['entries']:
+                if entry:
+                    results.append({
+                        'id': entry['id'],
+                        'title': entry.get('title', 'Unknown')[:60],
+                        'url': f"https://youtube.com/watch?v={entry['id']}",
+                        'channel': entry.get('channel', 'Unknown'),
+                        'duration': entry.get('duration', 0),
+                        'thumbnail': f"https://i.ytimg.com/vi/{entry['id']}/mqdefault.jpg",
+                    })
+        
+        self.cache_search(query, results)
+        return results
+    
+    def search_done(self, future, generation):
+        """Show a finished search, unless a newer one has started"""
+        if generation != self.search_generation:
+            return
         try:
-            ydl_opts = {
+            results = future.result()
+        except Exception as e:
+            if isinstance(e, ImportError):
+                forget_dependency_check()
+            self.status_label.configure(text="❌ Search failed")
+            return
+        
+        self.display_results_fast(results)
+        self.load_thumbnails(results, generation)
+    
+    def get_search_ydl(self):
+        """Shared YoutubeDL for searches, created on first use"""
+        if self.search_ydl is None:
+            import yt_dlp
+            self.search_ydl = yt_dlp.YoutubeDL({
                 'quiet': True,
-                'extract_flat': True,
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                search_query = f"ytsearch15:{query}"
-                info = ydl.extract_info(search_query, download=False)
-                
-                results = []
-                for entry in info['entries']:
-                    if entry:
-                        results.append({
-                            'title': entry.get('title', 'Unknown')[:60],
-                            'url': f"https://youtube.com/watch?v={entry['id']}",
-                            'channel': entry.get('channel', 'Unknown'),
-                            'duration': entry.get('duration', 0),
-                        })
-                
-                self.after(0, self.display_results_fast, results)
+                'no_warnings': True,
+                # Entries stay as the flat search-page records - id, title,
+                # channel and duration are all the result list needs
+                'extract_flat': 'in_playlist',
+                'skip_download': True,
+            })
+        return self.search_ydl
+    
+    def load_thumbnails(self, results, generation):
+        """Fetch result thumbnails concurrently, showing each as it arrives"""
+        for i, r in enumerate(results):
+            future = self.thumb_pool.submit(self.fetch_thumbnail, generation, r['id'], r['thumbnail'])
+            future.add_done_callback(functools.partial(self.thumbnail_done, generation, i))
+    
+    def thumbnail_done(self, generation, index, future):
+        """Hand a fetched thumbnail to the Tk thread"""
+        if future.cancelled() or future.exception() is not None:
+            return
+        image = future.result()
+        if image is not None:
+            self.after(0, self.set_result_thumbnail, generation, index, image)
+    
+    def fetch_thumbnail(self, generation, video_id, url):
+        """Load a thumbnail from disk, or download and decode it at display size"""
+        # A newer search has replaced these results - skip the work
+        if generation != self.search_generation:
+            return None
+        
+        from PIL import Image
+        
+        cache_path = THUMB_DIR / f"{video_id}.webp"
+        if cache_path.is_file():
+            try:
+                image = Image.open(cache_path)
+                image.load()
+                os.utime(cache_path)  # Keep recently shown thumbnails on prune
+                return image
+            except OSError:
+                # Corrupt or truncated - drop it and download again
+                try:
+                    cache_path.unlink()
+                except OSError:
+                    pass
+        
+        response = self.get_http().get(url, timeout=3)
+        response.raise_for_status()
+        
+        # draft() lets the JPEG decoder scale down during decoding
+        image = Image.open(BytesIO(response.content))
+        image.draft('RGB', THUMB_SIZE)
+        image.thumbnail(THUMB_SIZE, Image.Resampling.BILINEAR)
+        
+        # Save under a per-thread temp name and swap it in, so a failed
+        # or interrupted save never leaves a partial file at cache_path
+        tmp_path = THUMB_DIR / f"{video_id}.{threading.get_ident()}.tmp"
+        try:
+            THUMB_DIR.mkdir(exist_ok=True)
+            image.save(tmp_path, 'WEBP', quality=80, method=4)
+            os.replace(tmp_path, cache_path)
+        except (OSError, KeyError):  # KeyError: Pillow built without WebP
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        return image
+    
+    def get_http(self):
+        """Shared HTTP session - one TLS handshake per host"""
+        with self.http_lock:
+            if self.http is None:
+                # Deferred: only worker threads need requests, keep it off startup
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
                 
-        except Exception as e:
-            self.after(0, lambda: self.status_label.configure(text="❌ Search failed"))
+                self.http = requests.Session()
+                self.http.mount("https://", HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=THUMB_WORKERS,
+                    max_retries=Retry(total=3, backoff_factor=0.3)
+                ))
+            return self.http
+    
+    def _prewarm_thread(self):
+        """Resolve and connect to YouTube hosts before the user needs them"""
+        # Fills the DNS cache and the session's TLS connection pool
+        for url in ('https://www.youtube.com/', 'https://i.ytimg.com/'):
+            try:
+                self.get_http().head(url, timeout=5)
+            except Exception:
+                pass
+    
+    def prune_thumbnail_cache(self):
+        """Drop least recently used thumbnails until the cache fits its size cap"""
+        try:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                       for e in os.scandir(THUMB_DIR) if e.is_file()]
+        except OSError:
+            return
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= THUMB_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def set_result_thumbnail(self, generation, index, image):
+        """Show a thumbnail on its search result"""
+        # Ignore thumbnails that belong to an older search
+        if generation != self.search_generation:
+            return
+        
+        thumb = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+        if index < len(self.result_thumb_labels):
+            self.result_thumb_labels[index].configure(image=thumb)
+        else:
+            # Row not rendered yet - fill_result_item picks it up
+            self.pending_thumbs[index] = thumb
     
     def display_results_fast(self, results):
         """Display search results"""
-        for widget in self.search_results_frame.winfo_children():
-            widget.destroy()
+        # Unpack everything so rows re-pack below the header in order
+        self.results_empty_label.pack_forget()
+        self.results_header_label.pack_forget()
+        for row in self.result_rows:
+            row['frame'].pack_forget()
+        
+        self.result_thumb_labels = []
+        self.pending_thumbs = {}
         
         if not results:
-            ctk.CTkLabel(
-                self.search_results_frame, 
-                text="No results found",
-                font=ctk.CTkFont(size=14)
-            ).pack(pady=50)
+            self.results_empty_label.pack(pady=50)
             return
         
-        ctk.CTkLabel(
-            self.search_results_frame,
-            text=f"📊 Found {len(results)} results",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            text_color=self.colors['accent']
-        ).pack(anchor="w", pady=5)
-        
-        for r in results:
-            self.create_result_item(r)
+        self.results_header_label.configure(text=f"📊 Found {len(results)} results")
+        self.results_header_label.pack(anchor="w", pady=5)
+        self.render_results_chunk(results, 0, self.search_generation)
         
         self.status_label.configure(text=f"✅ Found {len(results)} results")
     
-    def create_result_item(self, result):
-        """Create search result item"""
-        frame = ctk.CTkFrame(self.search_results_frame, fg_color=self.colors['surface_light'])
-        frame.pack(fill="x", pady=1)
+    def render_results_chunk(self, results, start, generation):
+        """Render a few result rows, yielding to the event loop between chunks"""
+        if generation != self.search_generation:
+            return
         
-        ctk.CTkLabel(
+        end = start + RESULT_RENDER_CHUNK
+        for result in results[start:end]:
+            index = len(self.result_thumb_labels)
+            # Grow the pool only when needed, then refill rows in place
+            if index == len(self.result_rows):
+                self.result_rows.append(self.create_result_item())
+            row = self.result_rows[index]
+            self.fill_result_item(row, result, self.pending_thumbs.pop(index, None))
+            row['frame'].pack(fill="x", pady=1)
+            self.result_thumb_labels.append(row['thumb'])
+        
+        if end < len(results):
+            self.after_idle(self.render_results_chunk, results, end, generation)
+    
+    def create_result_item(self):
+        """Create an empty search result row"""
+        frame = ctk.CTkFrame(self.search_results_frame, fg_color=COLORS.surface_light)
+        
+        thumb_label = ctk.CTkLabel(
             frame,
-            text=result['title'],
-            font=ctk.CTkFont(size=12, weight="bold"),
-            anchor="w"
-        ).pack(anchor="w", padx=8, pady=(5, 0))
+            text="",
+            width=THUMB_SIZE[0],
+            height=THUMB_SIZE[1],
+            fg_color=COLORS.surface
+        )
+        thumb_label.pack(side="left", padx=(5, 0), pady=5)
         
-        duration = result.get('duration', 0)
-        if duration:
-            dur_str = f"{int(duration)//60}:{int(duration)%60:02d}"
-        else:
-            dur_str = "?:??"
+        title_label = ctk.CTkLabel(
+            frame,
+            text="",
+            font=self.get_font(12, "bold"),
+            anchor="w"
+        )
+        title_label.pack(anchor="w", padx=8, pady=(5, 0))
         
-        ctk.CTkLabel(
+        meta_label = ctk.CTkLabel(
             frame,
-            text=f"📺 {result.get('channel', 'Unknown')} | ⏱️ {dur_str}",
-            font=ctk.CTkFont(size=10),
+            text="",
+            font=self.get_font(10),
             text_color='gray'
-        ).pack(anchor="w", padx=8, pady=(0, 5))
+        )
+        meta_label.pack(anchor="w", padx=8, pady=(0, 5))
         
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
         btn_frame.pack(anchor="e", pady=5, padx=5)
         
-        ctk.CTkButton(
+        download_btn = ctk.CTkButton(
             btn_frame,
             text="📥 Download",
             width=90,
-            height=28,
-            command=lambda u=result['url']: self.download_from_search(u)
-        ).pack(side="left", padx=2)
+            height=28
+        )
+        download_btn.pack(side="left", padx=2)
         
-        ctk.CTkButton(
+        load_btn = ctk.CTkButton(
             btn_frame,
             text="👁️ Load",
             width=70,
-            height=28,
-            command=lambda u=result['url']: self.load_url(u)
-        ).pack(side="left", padx=2)
+            height=28
+        )
+        load_btn.pack(side="left", padx=2)
+        
+        return {'frame': frame, 'thumb': thumb_label, 'title': title_label,
+                'meta': meta_label, 'download': download_btn, 'load': load_btn}
+    
+    def fill_result_item(self, row, result, thumb=None):
+        """Show a search result in a result row"""
+        duration = result.get('duration', 0)
+        if duration:
+            dur_str = fmt_mmss(int(duration))
+        else:
+            dur_str = "?:??"
+        
+        # CTkLabel keeps its old image on image=None, so swap in a blank one
+        if thumb is None and self.blank_thumb is None:
+            from PIL import Image
+            blank = Image.new('RGBA', THUMB_SIZE, (0, 0, 0, 0))
+            self.blank_thumb = ctk.CTkImage(light_image=blank, dark_image=blank, size=THUMB_SIZE)
+        row['thumb'].configure(image=thumb or self.blank_thumb)
+        
+        row['title'].configure(text=result['title'])
+        row['meta'].configure(text=f"📺 {result.get('channel', 'Unknown')} | ⏱️ {dur_str}")
+        row['download'].configure(command=functools.partial(self.download_from_search, result['url']))
+        row['load'].configure(command=functools.partial(self.load_url, result['url']))
     
     def check_ffmpeg(self):
-        """Check FFmpeg status"""
+        """Check FFmpeg status in the background"""
+        self.executor.submit(self._check_ffmpeg_thread)
+    
+    def _check_ffmpeg_thread(self):
+        """Locate FFmpeg off the UI thread"""
+        # Known-good path first, then a PATH lookup - neither spawns a process
+        ffmpeg_path = self.settings.get('ffmpeg_path')
+        if not (ffmpeg_path and os.path.isfile(ffmpeg_path)):
+            ffmpeg_path = shutil.which('ffmpeg')
+            self.settings['ffmpeg_path'] = ffmpeg_path
+        
+        found = ffmpeg_path is not None
+        if not found:
+            found = self.probe_ffmpeg()
+        
+        self.after(0, self.apply_ffmpeg_status, found)
+    
+    def probe_ffmpeg(self):
+        """Ask the OS to run FFmpeg, reusing a recent answer from disk"""
         try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                   capture_output=True, text=True, timeout=2)
-            if result.returncode == 0:
-                self.ffmpeg_available = True
-                self.ffmpeg_badge.configure(
-                    text="🎵 FFmpeg: ✓ Ready",
-                    fg_color=self.colors['success']
-                )
-                self.ffmpeg_status_label.configure(
-                    text="✅ FFmpeg found",
-                    text_color=self.colors['success']
-                )
-            else:
-                raise Exception()
-        except:
-            self.ffmpeg_available = False
+            with open(FFMPEG_CACHE_FILE, 'rb') as f:
+                cached = load_json(f.read())
+            if 0 <= time.time() - cached['checked'] < FFMPEG_CACHE_TTL:
+                return cached['found']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        # Last resort: let the OS resolve it (e.g. next to the EXE on Windows)
+        found = False
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-version'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=CREATE_NO_WINDOW,
+                timeout=2
+            )
+            found = result.returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        
+        try:
+            with open(FFMPEG_CACHE_FILE, 'wb') as f:
+                f.write(dump_json({'checked': time.time(), 'found': found}))
+        except OSError:
+            pass
+        return found
+    
+    def apply_ffmpeg_status(self, found):
+        """Show whether FFmpeg is available"""
+        self.ffmpeg_available = found
+        if found:
+            self.ffmpeg_badge.configure(
+                text="🎵 FFmpeg: ✓ Ready",
+                fg_color=COLORS.success
+            )
+        else:
             self.ffmpeg_badge.configure(
                 text="🎵 FFmpeg: ✗ Not found",
-                fg_color=self.colors['warning']
+                fg_color=COLORS.warning
             )
+        self.update_ffmpeg_status_label()
+    
+    def update_ffmpeg_status_label(self):
+        """Mirror the FFmpeg check on the Settings tab, once both exist"""
+        if self.ffmpeg_status_label is None or self.ffmpeg_available is None:
+            return
+        
+        if self.ffmpeg_available:
+            self.ffmpeg_status_label.configure(
+                text="✅ FFmpeg found",
+                text_color=COLORS.success
+            )
+        else:
             self.ffmpeg_status_label.configure(
                 text="❌ FFmpeg not found - MP3 limited",
-                text_color=self.colors['warning']
+                text_color=COLORS.warning
             )
     
+    def preload_yt_dlp(self):
+        """Import yt-dlp in the background so the first analysis doesn't wait"""
+        try:
+            import yt_dlp
+        except ImportError:
+            pass
+    
     def paste_url(self):
         """Paste URL from clipboard"""
+        # Tk reads the clipboard directly - no xclip/xsel subprocess
+        try:
+            url = self.clipboard_get()
+        except tk.TclError:
+            url = ''  # Empty clipboard, or it doesn't hold text
+        
         try:
-            url = pyperclip.paste()
             if url:
                 self.url_entry.delete(0, 'end')
                 self.url_entry.insert(0, url)
                 self.update_download_button_state(url)
-                self.analyze_url_fast(url)
-        except:
+                self.schedule_analyze(url)
+        except tk.TclError:
             self.show_notification("❌ Could not paste")
     
     def load_url(self, url):
         """Load URL to download tab"""
-        self.main_tabview.set("📥 Download")
+        self.main_tabview.set(TAB_DOWNLOAD)
         self.url_entry.delete(0, 'end')
         self.url_entry.insert(0, url)
         self.update_download_button_state(url)
-        self.analyze_url_fast(url)
+        self.schedule_analyze(url)
     
     def download_from_search(self, url):
         """Download from search result"""
@@ -1068,6 +1840,7 @@ class YouTubeDownloaderPro(ctk.CTk):
         folder = filedialog.askdirectory(initialdir=self.download_path)
         if folder:
             self.download_path = folder
+            self.outtmpl = os.path.join(folder, '%(title)s.%(ext)s')
             self.settings['download_path'] = folder
             self.path_label.configure(text=folder)
     
@@ -1080,13 +1853,28 @@ class YouTubeDownloaderPro(ctk.CTk):
             "Fast": "fast"
         }
         self.settings['speed_limit'] = mapping.get(value, "unlimited")
+        self.speed_limit_value = SPEED_LIMITS[self.settings['speed_limit']]
+    
+    def ensure_download_dir(self):
+        """Create the download folder once per path"""
+        path = self.download_path
+        if path not in self.created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self.created_dirs.add(path)
     
     def open_download_folder(self):
         """Open download folder"""
+        self.ensure_download_dir()
         if sys.platform == 'win32':
             os.startfile(self.download_path)
         else:
-            subprocess.run(['xdg-open', self.download_path])
+            # Fire and forget so a slow file manager can't stall the UI
+            subprocess.Popen(
+                [FOLDER_OPENERS.get(sys.platform, 'xdg-open'), self.download_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
     
     def add_to_history(self, info):
         """Add to download history"""
@@ -1096,51 +1884,68 @@ class YouTubeDownloaderPro(ctk.CTk):
             'format': self.format_var.get(),
         }
         self.download_history.insert(0, item)
-        if len(self.download_history) > 20:
+        if len(self.download_history) > HISTORY_MAX_ITEMS:
             self.download_history.pop()
-        self.save_history()
+        self.save_history(item)
         self.refresh_recent()
     
     def refresh_recent(self):
         """Refresh recent downloads list"""
-        for widget in self.recent_list.winfo_children():
-            widget.destroy()
+        items = self.download_history[:MAX_VISIBLE_ROWS]
         
-        if not self.download_history:
-            ctk.CTkLabel(
-                self.recent_list,
-                text="✨ No downloads yet",
-                font=ctk.CTkFont(size=12),
-                text_color='gray'
-            ).pack(pady=20)
+        if not items:
+            for row in self.recent_rows:
+                self.hide_recent_item(row)
+            self.recent_empty_label.pack(pady=20)
             return
         
-        for item in self.download_history[:15]:
-            self.create_recent_item(item)
-    
-    def create_recent_item(self, item):
-        """Create a recent download item"""
-        frame = ctk.CTkFrame(self.recent_list, fg_color=self.colors['surface_light'])
-        frame.pack(fill="x", pady=1)
+        self.recent_empty_label.pack_forget()
+        
+        # Grow the pool only when needed, then refill rows in place
+        while len(self.recent_rows) < len(items):
+            self.recent_rows.append(self.create_recent_item())
+        
+        # Only touch rows whose item changed; hidden rows are re-packed in
+        # order after the visible ones, so list order is kept
+        for row, item in zip(self.recent_rows, items):
+            if row['item'] != item:
+                self.fill_recent_item(row, item)
+                row['item'] = item
+            if not row['shown']:
+                row['frame'].pack(fill="x", pady=1)
+                row['shown'] = True
         
-        icon = "🎬" if item['format'] == 'mp4' else "🎵" if item['format'] == 'mp3' else "📦"
+        for row in self.recent_rows[len(items):]:
+            self.hide_recent_item(row)
+    
+    def hide_recent_item(self, row):
+        """Unmap a recent download row, keeping it for reuse"""
+        if row['shown']:
+            row['frame'].pack_forget()
+            row['shown'] = False
+    
+    def create_recent_item(self):
+        """Create an empty recent download row"""
+        frame = ctk.CTkFrame(self.recent_list, fg_color=COLORS.surface_light)
         
         info_frame = ctk.CTkFrame(frame, fg_color="transparent")
         info_frame.pack(side="left", fill="x", expand=True, padx=8, pady=5)
         
-        ctk.CTkLabel(
+        title_label = ctk.CTkLabel(
             info_frame,
-            text=f"{icon} {item['title']}",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            text="",
+            font=self.get_font(11, "bold"),
             anchor="w"
-        ).pack(anchor="w")
+        )
+        title_label.pack(anchor="w")
         
-        ctk.CTkLabel(
+        meta_label = ctk.CTkLabel(
             info_frame,
-            text=f"🕒 {item['date']} | {item['format'].upper()}",
-            font=ctk.CTkFont(size=9),
+            text="",
+            font=self.get_font(9),
             text_color='gray'
-        ).pack(anchor="w")
+        )
+        meta_label.pack(anchor="w")
         
         ctk.CTkButton(
             frame,
@@ -1150,32 +1955,218 @@ class YouTubeDownloaderPro(ctk.CTk):
             command=self.open_download_folder,
             fg_color="transparent"
         ).pack(side="right", padx=2)
+        
+        return {'frame': frame, 'title': title_label, 'meta': meta_label,
+                'item': None, 'shown': False}
+    
+    def fill_recent_item(self, row, item):
+        """Show a history item in a recent download row"""
+        fmt = item['format']
+        icon = FORMAT_ICONS.get(fmt, "📦")
+        
+        row['title'].configure(text=f"{icon} {item['title']}")
+        row['meta'].configure(text=f"🕒 {item['date']} | {FORMAT_LABELS.get(fmt) or fmt.upper()}")
     
     def show_notification(self, msg):
         """Show notification"""
         self.status_label.configure(text=msg)
-        self.after(3000, lambda: self.status_label.configure(text="✅ Ready"))
+        self.after(3000, functools.partial(self.status_label.configure, text=STATUS_READY))
     
     def lighten_color(self, color):
         """Lighten color for hover"""
-        return color
+        return lighten_color(color)
     
-    def save_history(self):
-        """Save download history"""
-        try:
-            with open(Path.home() / '.yt_pro_history.dat', 'wb') as f:
-                pickle.dump(self.download_history, f)
-        except:
-            pass
+    def save_history(self, item=None):
+        """Schedule a history write, batching changes made close together"""
+        # A new item is appended to the log; anything else rewrites it
+        if item is None:
+            self.history_rewrite = True
+            self.history_appends = []
+        elif not self.history_rewrite:
+            self.history_appends.append(item)
+        
+        if self.history_save_id is None:
+            self.history_save_id = self.after(HISTORY_SAVE_DELAY_MS, self.flush_history)
+    
+    def flush_history(self, wait=False):
+        """Write pending history changes, in the background unless wait"""
+        self.history_save_id = None
+        if self.history_rewrite:
+            job = (self._rewrite_history_thread, list(reversed(self.download_history)))
+        else:
+            job = (self._append_history_thread, self.history_appends)
+        self.history_rewrite = False
+        self.history_appends = []
+        
+        if wait:
+            job[0](job[1])
+        else:
+            self.history_future = self.executor.submit(*job)
+    
+    def _append_history_thread(self, items):
+        """Append new items to the history log"""
+        with self.history_lock:
+            try:
+                with open(HISTORY_FILE, 'ab') as f:
+                    f.write(b''.join(dump_json(item) + b'\n' for item in items))
+            except OSError:
+                pass
+    
+    def _rewrite_history_thread(self, items):
+        """Replace the history log with the given items"""
+        # Write a temp file and swap it in so a crash can't truncate history
+        with self.history_lock:
+            try:
+                with open(HISTORY_TMP_FILE, 'wb') as f:
+                    f.write(b''.join(dump_json(item) + b'\n' for item in items))
+                os.replace(HISTORY_TMP_FILE, HISTORY_FILE)
+            except OSError:
+                pass
     
     def load_history(self):
         """Load download history"""
         try:
-            with open(Path.home() / '.yt_pro_history.dat', 'rb') as f:
-                self.download_history = pickle.load(f)
-            self.refresh_recent()
-        except:
+            with open(HISTORY_FILE, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            self.migrate_legacy_history()
+            return
+        except OSError:
+            return
+        
+        # Newest entries are at the end; skip any torn or corrupt line
+        history = []
+        for line in reversed(lines):
+            if len(history) == HISTORY_MAX_ITEMS:
+                break
+            try:
+                history.append(load_json(line))
+            except ValueError:
+                pass
+        self.download_history = history
+        
+        if len(lines) > HISTORY_COMPACT_LINES:
+            self.save_history()
+        self.refresh_recent()
+    
+    def migrate_legacy_history(self):
+        """Convert history saved by older versions to the log format"""
+        try:
+            with open(LEGACY_HISTORY_FILE, 'rb') as f:
+                history = pickle.load(f)
+        except Exception:
+            return
+        self.download_history = history[:HISTORY_MAX_ITEMS]
+        self.save_history()
+        self.refresh_recent()
+    
+    def cache_file(self, key):
+        """Disk cache path for a cache key"""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return CACHE_DIR / f"{digest}.json"
+    
+    def on_close(self):
+        """Stop background work and close the window"""
+        self.closing = True
+        # Drop queued jobs - pool threads aren't daemons and would keep
+        # downloading with no window
+        for pool in (self.download_pool, self.executor, self.analyze_pool, self.thumb_pool):
+            pool.shutdown(wait=False, cancel_futures=True)
+        if self.history_save_id is not None:
+            self.after_cancel(self.history_save_id)
+        if self.history_future is not None and self.history_future.cancelled():
+            # A queued history write never ran - rewrite the whole log instead
+            self.history_rewrite = True
+        if self.history_save_id is not None or self.history_rewrite:
+            # Write pending history now rather than lose it
+            self.flush_history(wait=True)
+        self.destroy()
+    
+    def clear_dns_cache(self):
+        """Expire cached DNS answers periodically"""
+        cached_getaddrinfo.cache_clear()
+        self.after(DNS_CACHE_TTL_MS, self.clear_dns_cache)
+    
+    def get_cached_info(self, url):
+        """Get analyzed info from the in-memory cache"""
+        key = video_cache_key(url)
+        with self.cache_lock:
+            entry = self.video_info_cache.get(key)
+            if entry is None:
+                return None
+            # Expired entries are dropped on access instead of lingering.
+            # Memory entries use the monotonic clock so clock jumps can't
+            # revive or expire them; the disk tier must use wall time.
+            if time.monotonic() - entry[0] >= CACHE_TTL:
+                del self.video_info_cache[key]
+                return None
+            self.video_info_cache.move_to_end(key)
+            return entry[1]
+    
+    def get_disk_info(self, url):
+        """Get analyzed info from the disk cache, promoting it into memory"""
+        key = video_cache_key(url)
+        path = self.cache_file(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        try:
+            entry = load_json(data)
+            age = time.time() - entry['saved']
+            info = entry['info']
+            fresh = 0 <= age < CACHE_TTL
+        except (ValueError, KeyError, TypeError):
+            fresh = False
+        if not fresh:
+            # Expired or corrupt entries are deleted on access
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        
+        with self.cache_lock:
+            self.video_info_cache[key] = (time.monotonic() - age, info)
+            if len(self.video_info_cache) > CACHE_MAX_ITEMS:
+                self.video_info_cache.popitem(last=False)
+        return info
+    
+    def cache_info(self, url, info):
+        """Store analyzed info in memory and on disk"""
+        key = video_cache_key(url)
+        with self.cache_lock:
+            self.video_info_cache[key] = (time.monotonic(), info)
+            self.video_info_cache.move_to_end(key)
+            if len(self.video_info_cache) > CACHE_MAX_ITEMS:
+                self.video_info_cache.popitem(last=False)
+        
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            with open(self.cache_file(key), 'wb') as f:
+                f.write(dump_json({'saved': time.time(), 'info': info}))
+        except (OSError, TypeError):
             pass
+    
+    def prune_info_cache(self):
+        """Delete expired analysis cache files and cap how many are kept"""
+        try:
+            entries = sorted(((e.stat().st_mtime, e.path)
+                              for e in os.scandir(CACHE_DIR) if e.is_file()),
+                             reverse=True)
+        except OSError:
+            return
+        
+        now = time.time()
+        for i, (mtime, path) in enumerate(entries):
+            if i < CACHE_DISK_MAX_ITEMS and 0 <= now - mtime < CACHE_TTL:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
 
 # ========== MAIN ==========
@@ -1190,11 +2181,12 @@ if __name__ == "__main__":
     
     try:
         # Set DPI awareness for better display
-        try:
-            import ctypes
-            ctypes.windll.shcore.SetProcessDpiAwareness(1)
-        except:
-            pass
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                ctypes.windll.shcore.SetProcessDpiAwareness(1)
+            except:
+                pass
         
         app = YouTubeDownloaderPro()
         app.mainloop()